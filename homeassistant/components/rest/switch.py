@@ -6,7 +6,6 @@ from http import HTTPStatus
 import logging
 from typing import Any
 
-import async_timeout
 import httpx
 import voluptuous as vol
 
@@ -102,6 +101,16 @@ async def async_setup_platform(
         raise PlatformNotReady(f"No route to resource/endpoint: {resource}") from exc
 
 
+def _render_body(body: template.Template) -> bytes:
+    """Render a body template and encode it for sending."""
+    return body.async_render(parse_result=False).encode("utf-8")
+
+
+def _is_static(templates: dict[str, template.Template] | None) -> bool:
+    """Return if a mapping of templates renders the same on every call."""
+    return templates is not None and all(tpl.is_static for tpl in templates.values())
+
+
 class RestSwitch(TemplateEntity, SwitchEntity):
     """Representation of a switch that can be toggled using REST."""
 
@@ -142,15 +151,33 @@ class RestSwitch(TemplateEntity, SwitchEntity):
 
         self._body_on.hass = hass
         self._body_off.hass = hass
+        # Static bodies render to the same string on every call, encode them once
+        self._body_on_bytes: bytes | None = (
+            _render_body(self._body_on) if self._body_on.is_static else None
+        )
+        self._body_off_bytes: bytes | None = (
+            _render_body(self._body_off) if self._body_off.is_static else None
+        )
         if (is_on_template := self._is_on_template) is not None:
             is_on_template.hass = hass
 
         template.attach(hass, self._headers)
         template.attach(hass, self._params)
 
+        # Headers and params without templates render the same on every call
+        self._static_headers: dict[str, str] | None = None
+        self._static_params: dict[str, Any] | None = None
+        if _is_static(self._headers):
+            self._static_headers = template.render_complex(
+                self._headers, parse_result=False
+            )
+        if _is_static(self._params):
+            self._static_params = template.render_complex(self._params)
+
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the device on."""
-        body_on_t = self._body_on.async_render(parse_result=False)
+        if (body_on_t := self._body_on_bytes) is None:
+            body_on_t = _render_body(self._body_on)
 
         try:
             req = await self.set_device_state(body_on_t)
@@ -166,7 +193,8 @@ class RestSwitch(TemplateEntity, SwitchEntity):
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the device off."""
-        body_off_t = self._body_off.async_render(parse_result=False)
+        if (body_off_t := self._body_off_bytes) is None:
+            body_off_t = _render_body(self._body_off)
 
         try:
             req = await self.set_device_state(body_off_t)
@@ -179,18 +207,32 @@ class RestSwitch(TemplateEntity, SwitchEntity):
         except (asyncio.TimeoutError, httpx.RequestError):
             _LOGGER.error("Error while switching off %s", self._resource)
 
-    async def set_device_state(self, body: Any) -> httpx.Response:
+    def _render_headers_params(
+        self,
+    ) -> tuple[dict[str, str] | None, dict[str, Any] | None]:
+        """Render the request headers and params, reusing static ones."""
+        rendered_headers = self._static_headers
+        if rendered_headers is None:
+            rendered_headers = template.render_complex(
+                self._headers, parse_result=False
+            )
+        rendered_params = self._static_params
+        if rendered_params is None:
+            rendered_params = template.render_complex(self._params)
+        return rendered_headers, rendered_params
+
+    async def set_device_state(self, body: bytes) -> httpx.Response:
         """Send a state update to the device."""
         websession = get_async_client(self.hass, self._verify_ssl)
 
-        rendered_headers = template.render_complex(self._headers, parse_result=False)
-        rendered_params = template.render_complex(self._params)
+        rendered_headers, rendered_params = self._render_headers_params()
 
-        async with async_timeout.timeout(self._timeout):
-            req: httpx.Response = await getattr(websession, self._method)(
+        async with asyncio.timeout(self._timeout):
+            req = await websession.request(
+                self._method,
                 self._resource,
                 auth=self._auth,
-                data=bytes(body, "utf-8"),
+                content=body,
                 headers=rendered_headers,
                 params=rendered_params,
             )
@@ -209,10 +251,9 @@ class RestSwitch(TemplateEntity, SwitchEntity):
         """Get the latest data from REST API and update the state."""
         websession = get_async_client(hass, self._verify_ssl)
 
-        rendered_headers = template.render_complex(self._headers, parse_result=False)
-        rendered_params = template.render_complex(self._params)
+        rendered_headers, rendered_params = self._render_headers_params()
 
-        async with async_timeout.timeout(self._timeout):
+        async with asyncio.timeout(self._timeout):
             req = await websession.get(
                 self._state_resource,
                 auth=self._auth,
@@ -313,6 +313,66 @@ async def test_turn_on_timeout(hass: HomeAssistant) -> None:
     assert hass.states.get("switch.foo").state == STATE_UNKNOWN
 
 
+@pytest.mark.parametrize("method", ["put", "patch"])
+@respx.mock
+async def test_turn_on_method(hass: HomeAssistant, method: str) -> None:
+    """Test turn_on with a non-default method."""
+    respx.get(RESOURCE) % HTTPStatus.OK
+    config = {
+        CONF_PLATFORM: DOMAIN,
+        CONF_NAME: NAME,
+        CONF_RESOURCE: RESOURCE,
+        CONF_METHOD: method,
+    }
+    assert await async_setup_component(hass, SWITCH_DOMAIN, {SWITCH_DOMAIN: config})
+    await hass.async_block_till_done()
+
+    route = respx.route(method=method.upper(), url=RESOURCE) % HTTPStatus.OK
+    respx.get(RESOURCE).mock(side_effect=httpx.RequestError)
+    await hass.services.async_call(
+        SWITCH_DOMAIN,
+        SERVICE_TURN_ON,
+        {ATTR_ENTITY_ID: "switch.foo"},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    assert route.call_count == 1
+    assert route.calls[-1].request.content.decode() == "ON"
+    assert hass.states.get("switch.foo").state == STATE_ON
+
+
+@respx.mock
+async def test_turn_on_templated_body(hass: HomeAssistant) -> None:
+    """Test turn_on renders a templated body on every call."""
+    respx.get(RESOURCE) % HTTPStatus.OK
+    config = {
+        CONF_PLATFORM: DOMAIN,
+        CONF_NAME: NAME,
+        CONF_RESOURCE: RESOURCE,
+        CONF_BODY_ON: '{"level": {{ states("input_number.level") }}}',
+    }
+    assert await async_setup_component(hass, SWITCH_DOMAIN, {SWITCH_DOMAIN: config})
+    await hass.async_block_till_done()
+
+    route = respx.post(RESOURCE) % HTTPStatus.OK
+    respx.get(RESOURCE).mock(side_effect=httpx.RequestError)
+    for level in ("20", "80"):
+        hass.states.async_set("input_number.level", level)
+        await hass.services.async_call(
+            SWITCH_DOMAIN,
+            SERVICE_TURN_ON,
+            {ATTR_ENTITY_ID: "switch.foo"},
+            blocking=True,
+        )
+        await hass.async_block_till_done()
+
+        last_request: httpx.Request = route.calls[-1].request
+        assert last_request.content.decode() == f'{{"level": {level}}}'
+
+    assert hass.states.get("switch.foo").state == STATE_ON
+
+
 @respx.mock
 async def test_turn_off_success(hass: HomeAssistant) -> None:
     """Test turn_off."""